@@ -1,8 +1,12 @@
 import pandas as pd
-from thefuzz import process
+from rapidfuzz import process, fuzz, utils
 import logging
+import json
+import hashlib
 from pathlib import Path
-import shutil
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import os
 import openpyxl
 import numpy as np
 
@@ -10,6 +14,16 @@ import numpy as np
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# thefuzz dropped these characters before scoring, keep doing so to get the same matches
+_LATIN1_CHARS = {i: None for i in range(128, 256)}
+
+# Maximum number of fuzzy matches kept in the cache, least recently used are dropped first
+_MATCH_CACHE_SIZE = 4096
+
+def _process_food_name(name: str) -> str:
+    """Normalize a food name for fuzzy matching (lowercase, alphanumerics only, ASCII)."""
+    return utils.default_process(name.translate(_LATIN1_CHARS))
+
 class NutritionCalculator:
     """
     A class to calculate nutritional intake from food frequency questionnaire data.
@@ -51,19 +65,118 @@ class NutritionCalculator:
             "Viande de porc : rôti, émincés, côte, filet mignon"
         }
         
+        # Substrings of the reference nutrient names mapped to nutrition data columns,
+        # checked in order so the first matching key wins
+        self.nutrient_mapping = {
+            "protéines": "proteines",
+            "glucides": "glucides",
+            "lipides": "lipides",
+            "sucres": "sucres",
+            "fibres": "fibres",
+            "ag saturés": "ags",
+            "matières grasses": "lipides",
+            "sel": "sel",
+            "vitamine a": "retinol",
+            "vitamine b1": "vitamine_b1",
+            "vitamine b2": "vitamine_b2",
+            "vitamine b3": "vitamine_b3",
+            "vitamine b5": "vitamine_b5",
+            "vitamine b6": "vitamine_b6",
+            "vitamine b9": "vitamine_b9",
+            "vitamine b12": "vitamine_b12",
+            "vitamine c": "vitamine_c",
+            "vitamine d": "vitamine_d",
+            "vitamine e": "vitamine_e",
+            "vitamine k": "vitamine_k2",
+            "calcium": "calcium",
+            "cuivre": "cuivre",
+            "fer": "fer",
+            "iode": "iode",
+            "magnesium": "magnesium",
+            "phosphore": "phosphore",
+            "potassium": "potassium",
+            "selenium": "selenium",
+            "sodium": "sodium",
+            "zinc": "zinc"
+        }
+        
         self._load_nutrition_data()
+        
+        # Fuzzy matches are cached on disk and reused across runs
+        self._match_cache_path = self.nutrition_data_path.parent / '.food_match_cache.json'
+        self._load_match_cache()
+        # Cache keys used by the last survey, so their recency can be reported back to main()
+        self._used_match_keys = []
     
     def _load_nutrition_data(self) -> None:
         """Load and prepare nutrition reference data."""
         try:
-            self.nutrition_df = pd.read_excel(self.nutrition_data_path)
-            self.food_groups = self.nutrition_df['groupe_ffq'].tolist()
-            logger.info(f"Loaded nutrition data with {len(self.nutrition_df)} food groups")
+            self.nutrition_df = pd.read_excel(self.nutrition_data_path, engine='calamine').set_index('groupe_ffq')
+            self.food_groups = self.nutrition_df.index.tolist()
+            self._food_groups_processed = [_process_food_name(group) for group in self.food_groups]
+            
+            # Case and whitespace insensitive lookup for names that need no fuzzy matching
+            self._exact_index = {}
+            for group in self.food_groups:
+                self._exact_index.setdefault(group.casefold().strip(), group)
+            
+            # Numeric nutrients-per-100g matrix, one row per food group, built once and
+            # reused for every survey
+            exclude_cols = {'groupe_ffq', 'food_item', 'matched_food_group', 'daily_frequency', 
+                           'portion_grams', 'portion_small', 'portion_medium', 'portion_large'}
+            self._nutrient_cols = [col for col in self.nutrition_df.columns if col not in exclude_cols]
+            self._nutrient_matrix = np.ascontiguousarray(
+                self.nutrition_df[self._nutrient_cols]
+                .apply(pd.to_numeric, errors='coerce')
+                .fillna(0)
+                .to_numpy(dtype=np.float64)
+            )
+            logger.info("Loaded nutrition data with %d food groups", len(self.nutrition_df))
         except FileNotFoundError:
             raise FileNotFoundError(f"Nutrition data file not found: {self.nutrition_data_path}")
         except Exception as e:
             raise Exception(f"Error loading nutrition data: {e}")
     
+    def _food_groups_hash(self) -> str:
+        """Fingerprint of the food group names, used to invalidate the match cache."""
+        return hashlib.sha256('\n'.join(self.food_groups).encode('utf-8')).hexdigest()
+    
+    def _load_match_cache(self) -> None:
+        """Load cached food matches, discarding them if the food groups have changed."""
+        self._match_cache = {}
+        try:
+            cache = json.loads(self._match_cache_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        
+        # A damaged cache is ignored rather than stopping the processing
+        if not isinstance(cache, dict) or not isinstance(cache.get('matches'), dict):
+            logger.warning("Ignoring invalid food match cache: %s", self._match_cache_path)
+            return
+        
+        if cache.get('food_groups_hash') == self._food_groups_hash():
+            self._match_cache = cache['matches']
+            logger.info("Loaded %d cached food matches", len(self._match_cache))
+    
+    def _trim_match_cache(self, recent_keys=()) -> None:
+        """Mark recent_keys as most recently used and drop the oldest matches above the size limit."""
+        for key in recent_keys:
+            self._match_cache[key] = self._match_cache.pop(key)
+        while len(self._match_cache) > _MATCH_CACHE_SIZE:
+            del self._match_cache[next(iter(self._match_cache))]
+    
+    def _save_match_cache(self) -> None:
+        """Save the food match cache next to the nutrition data."""
+        self._trim_match_cache()
+        cache = {
+            'food_groups_hash': self._food_groups_hash(),
+            'matches': self._match_cache
+        }
+        try:
+            self._match_cache_path.write_text(json.dumps(cache, ensure_ascii=False), encoding='utf-8')
+        except OSError as e:
+            logger.warning("Could not save food match cache: %s", e)
+    
     def _clean_survey_data(self, survey_df: pd.DataFrame) -> pd.DataFrame:
         """
         Clean and prepare survey data for processing.
@@ -90,13 +203,17 @@ class NutritionCalculator:
         # Get frequency columns from the keys of frequency_multipliers
         freq_columns = [col for col in self.frequency_multipliers.keys() if col in survey_df.columns]
         
-        survey_df[freq_columns] = survey_df[freq_columns].fillna('0')
+        # Responses only take a handful of distinct values ('1', '2', '3', 'x', ...), so each
+        # distinct string is converted once and the result broadcast back to every cell
+        freq_values = survey_df[freq_columns].fillna('0').to_numpy(dtype=str)
+        distinct, inverse = np.unique(freq_values, return_inverse=True)
+        distinct_numeric = pd.to_numeric(pd.Series(distinct).str.replace('x', '1'), errors='coerce').fillna(0)
+        survey_df[freq_columns] = distinct_numeric.to_numpy()[inverse].reshape(freq_values.shape)
         
-        for col in freq_columns:
-            survey_df[col] = survey_df[col].astype(str).str.replace('x', '1')
-            survey_df[col] = pd.to_numeric(survey_df[col], errors='coerce').fillna(0)
+        portion_columns = [col for col in ('portion_small', 'portion_medium', 'portion_large') if col in survey_df.columns]
+        survey_df[portion_columns] = survey_df[portion_columns].apply(pd.to_numeric, errors='coerce').fillna(0)
         
-        logger.info(f"After cleaning: {len(survey_df)} valid food items")
+        logger.info("After cleaning: %d valid food items", len(survey_df))
         return survey_df
     
     def _calculate_daily_portions(self, survey_df: pd.DataFrame) -> pd.DataFrame:
@@ -104,32 +221,25 @@ class NutritionCalculator:
         Calculate daily portions for each food item based on frequency responses.
         """
         portion_columns = ['portion_small', 'portion_medium', 'portion_large']
-        for col in portion_columns:
-            if col in survey_df.columns:
-                survey_df[col] = pd.to_numeric(survey_df[col], errors='coerce').fillna(0)
-        
-        survey_df['daily_frequency'] = 0.0
-        survey_df['portion_grams'] = 0
-        
-        # Iterate through the actual frequency columns in the DataFrame
-        for freq_col_name, time_multiplier in self.frequency_multipliers.items():
-            if freq_col_name in survey_df.columns:
-                freq_values = survey_df[freq_col_name]
-                for idx, freq_value in freq_values.items():
-                    if freq_value > 0:  # If this frequency is selected
-                        # Determine portion size based on the value (1, 2, or 3)
-                        if freq_value == 1:
-                            portion_weight = survey_df.loc[idx, 'portion_small']
-                        elif freq_value == 2:
-                            portion_weight = survey_df.loc[idx, 'portion_medium']
-                        elif freq_value == 3:
-                            portion_weight = survey_df.loc[idx, 'portion_large']
-                        else:
-                            portion_weight = survey_df.loc[idx, 'portion_medium']
-                        
-                        survey_df.loc[idx, 'daily_frequency'] += time_multiplier
-                        survey_df.loc[idx, 'portion_grams'] = portion_weight
-        
+        freq_columns = [col for col in self.frequency_multipliers.keys() if col in survey_df.columns]
+        multipliers = np.array([self.frequency_multipliers[col] for col in freq_columns], dtype=np.float64)
+        freq_values = survey_df[freq_columns].to_numpy(dtype=np.float64)
+        portions = survey_df[portion_columns].to_numpy(dtype=np.float64)
+
+        # Every selected frequency column adds its multiplier to the daily frequency
+        selected = freq_values > 0
+        survey_df['daily_frequency'] = selected.astype(np.float64) @ multipliers
+
+        # The last selected frequency column decides the portion size (1, 2, or 3);
+        # rows without any selection keep a portion of 0
+        last_selected = np.where(selected, np.arange(len(freq_columns)), -1).max(axis=1, initial=-1)
+        rows = np.flatnonzero(last_selected >= 0)
+        chosen = freq_values[rows, last_selected[rows]]
+        portion_idx = np.select([chosen == 1, chosen == 3], [0, 2], default=1)
+        portion_grams = np.zeros(len(survey_df))
+        portion_grams[rows] = portions[rows, portion_idx]
+        survey_df['portion_grams'] = portion_grams
+
         survey_df['daily_grams'] = survey_df['daily_frequency'] * survey_df['portion_grams']
         return survey_df
     
@@ -144,40 +254,66 @@ class NutritionCalculator:
         Returns:
             Survey dataframe with matched food groups
         """
-        def find_best_match(food_item: str):
-            if pd.isna(food_item):
-                return None
-            match, score = process.extractOne(food_item, self.food_groups)
-            return match if score >= min_score else None
-        
-        survey_df['matched_food_group'] = survey_df['food_item'].apply(find_best_match)
-        
-        # Apply manual corrections - ensure 'food_item' is the only column accessed here
-        survey_df['matched_food_group'] = survey_df.apply(
-            lambda row: self.manual_corrections.get(row['food_item'], row['matched_food_group']),
-            axis=1
+        food_items = survey_df['food_item'].astype(object)
+        
+        # Names found verbatim in the nutrition data skip fuzzy matching entirely
+        exact_matches = food_items.map(
+            lambda food_item: self._exact_index.get(food_item.casefold().strip()),
+            na_action='ignore'
+        )
+        
+        # The match only depends on the processed name, so it is a lossless cache key
+        queries = food_items[exact_matches.isna()].map(
+            lambda food_item: f"{min_score}|{_process_food_name(food_item)}",
+            na_action='ignore'
+        )
+        keys = queries.dropna().unique()
+        misses = [key for key in keys if key not in self._match_cache]
+        
+        if misses:
+            # Score all new names against all food groups in a single native call
+            scores = process.cdist(
+                [key.split('|', 1)[1] for key in misses],
+                self._food_groups_processed,
+                scorer=fuzz.WRatio,
+                dtype=np.float64
+            )
+            best_idx = scores.argmax(axis=1)
+            best_score = scores[np.arange(len(misses)), best_idx]
+            # Scores used to be rounded before the comparison, hence the half point of slack
+            for key, idx, score in zip(misses, best_idx, best_score):
+                self._match_cache[key] = self.food_groups[idx] if score >= min_score - 0.5 else None
+        
+        survey_df['matched_food_group'] = exact_matches.fillna(queries.map(self._match_cache, na_action='ignore'))
+        self._trim_match_cache(keys)
+        self._used_match_keys = list(keys)
+        
+        # Apply manual corrections
+        corrections = food_items.map(self.manual_corrections)
+        matched_groups = corrections.fillna(survey_df['matched_food_group'])
+        
+        # Categorical codes are the row positions in the nutrition data; names missing from it get -1
+        survey_df['matched_food_group'] = pd.Categorical.from_codes(
+            self.nutrition_df.index.get_indexer(matched_groups),
+            categories=self.food_groups
         )
         
         total_items = len(survey_df)
         matched_items = survey_df['matched_food_group'].notna().sum()
-        logger.info(f"Matched {matched_items}/{total_items} food items ({matched_items/total_items*100:.1f}%)")
+        logger.info("Matched %d/%d food items (%.1f%%)", matched_items, total_items, matched_items/total_items*100)
         
         return survey_df
     
-    def _calculate_total_nutrition(self, merged_df: pd.DataFrame) -> pd.Series:
+    def _calculate_total_nutrition(self, survey_df: pd.DataFrame) -> pd.Series:
         """
         Calculate total nutritional intake by multiplying daily grams with nutritional values per 100g.
         """
-        exclude_cols = {'groupe_ffq', 'food_item', 'matched_food_group', 'daily_frequency', 
-                       'portion_grams', 'portion_small', 'portion_medium', 'portion_large'}
-        nutrient_columns = [col for col in self.nutrition_df.columns if col not in exclude_cols]
-        total_nutrition = pd.Series(dtype=float)
+        group_idx = survey_df['matched_food_group'].cat.codes.to_numpy()
+        matched = group_idx >= 0
+        daily_grams = survey_df['daily_grams'].to_numpy(dtype=np.float64)[matched]
         
-        for nutrient in nutrient_columns:
-            if nutrient in merged_df.columns:
-                nutrient_intake = (merged_df['daily_grams'] / 100.0 * 
-                                 pd.to_numeric(merged_df[nutrient], errors='coerce')).fillna(0)
-                total_nutrition[nutrient] = nutrient_intake.sum()
+        totals = (daily_grams / 100.0) @ self._nutrient_matrix[group_idx[matched]]
+        total_nutrition = pd.Series(totals, index=self._nutrient_cols)
         
         return total_nutrition
     
@@ -190,48 +326,38 @@ class NutritionCalculator:
             output_dir = Path(output_dir)
             output_dir.mkdir(parents=True, exist_ok=True)
             
-            logger.info(f"Processing survey: {survey_path.name}")
+            logger.info("Processing survey: %s", survey_path.name)
 
-            # Read sex from cell K2
-            workbook = openpyxl.load_workbook(survey_path)
-            sheet = workbook.active
-            sex = sheet['K2'].value # Assuming K2 contains the sex
-            if not sex or sex.upper() not in ['M', 'F']:
+            # Read the sheet once; cell K2 is the first data row of column 10
+            survey_df = pd.read_excel(survey_path, header=0, dtype=str, engine='calamine')
+            sex = survey_df.iat[0, 10] if survey_df.shape[0] > 0 and survey_df.shape[1] > 10 else None
+            if pd.isna(sex) or sex.upper() not in ['M', 'F']:
                 raise ValueError("Sex not specified or invalid in cell K2. Should be 'M' or 'F'.")
             sex = sex.upper()
 
-            survey_df = pd.read_excel(survey_path, header=0, dtype=str) # Changed header to 0
-            logger.info(f"Loaded survey with {len(survey_df)} food items")
+            logger.info("Loaded survey with %d food items", len(survey_df))
             
             survey_df = self._clean_survey_data(survey_df)
             survey_df = self._calculate_daily_portions(survey_df)
 
             # Aggregate duplicate food items by summing their daily_grams
-            # Ensure 'food_item' is the index for groupby if it's not already
-            survey_df = survey_df.groupby('food_item', as_index=False)['daily_grams'].sum()
+            # Grouping on categorical codes avoids hashing every food name
+            survey_df['food_item'] = survey_df['food_item'].astype('category')
+            survey_df = survey_df.groupby('food_item', as_index=False, observed=True, sort=False)['daily_grams'].sum()
             
             survey_df = self._match_food_groups(survey_df)
-            
-            merged_df = pd.merge(
-                survey_df, 
-                self.nutrition_df, 
-                left_on='matched_food_group', 
-                right_on='groupe_ffq', 
-                how='left'
-            )
-            
-            total_nutrition = self._calculate_total_nutrition(merged_df)
+            total_nutrition = self._calculate_total_nutrition(survey_df)
             
             output_filename = survey_path.stem + "_nutrition_summary.xlsx"
             output_path = output_dir / output_filename
             
             self._save_results(sex, survey_path.name, total_nutrition, output_path)
             
-            logger.info(f"Successfully saved summary to: {output_path}")
+            logger.info("Successfully saved summary to: %s", output_path)
             return sex, total_nutrition
             
         except Exception as e:
-            logger.error(f"Error processing {survey_path}: {e}")
+            logger.error("Error processing %s: %s", survey_path, e)
             raise
     
     def _save_results(self, sex: str, survey_filename: str, total_nutrition: pd.Series, output_path: Path) -> None:
@@ -239,73 +365,50 @@ class NutritionCalculator:
         Save calculation results to an Excel file, comparing with reference values.
         """
         ref_path = self.ref_man_path if sex == 'M' else self.ref_woman_path
-        shutil.copy(ref_path, output_path)
-
-        df = pd.read_excel(output_path, header=0) # Changed header to 0
-        df.columns = df.columns.str.strip()
+        workbook = openpyxl.load_workbook(ref_path)
+        sheet = workbook.active
 
-        val_obtenues_col = None
-        for col in df.columns:
-            if "Valeurs obtenues" in str(col):
-                val_obtenues_col = col
-                break
+        # Patch the reference sheet in place so its formatting is kept
+        headers = {str(cell.value).strip(): cell.column for cell in sheet[1] if cell.value is not None}
+        val_obtenues_col = next((col for name, col in headers.items() if "Valeurs obtenues" in name), None)
         
         if not val_obtenues_col:
             raise ValueError("Column 'Valeurs obtenues' not found in the reference file.")
 
-        nutrient_col = df.columns[0]
-        ref_col = df.columns[1]
+        diff_col = headers.get('Difference (%)', max(headers.values()) + 1)
+        sheet.cell(row=1, column=diff_col, value='Difference (%)')
 
-        df[ref_col] = df[ref_col].astype(str).str.extract(r'(\d+\.?\d*)').astype(float)
-        df[val_obtenues_col] = pd.to_numeric(df[val_obtenues_col], errors='coerce')
+        rows = [row for row in sheet.iter_rows(min_row=2) if row[0].value is not None]
+        df = pd.DataFrame({
+            'nutrient': [row[0].value for row in rows],
+            'ref': [row[1].value for row in rows],
+            'obtained': [row[val_obtenues_col - 1].value for row in rows],
+        })
 
-        nutrient_mapping = {
-            "protéines": "proteines",
-            "glucides": "glucides",
-            "lipides": "lipides",
-            "sucres": "sucres",
-            "fibres": "fibres",
-            "ag saturés": "ags",
-            "matières grasses": "lipides",
-            "sel": "sel",
-            "vitamine a": "retinol",
-            "vitamine b1": "vitamine_b1",
-            "vitamine b2": "vitamine_b2",
-            "vitamine b3": "vitamine_b3",
-            "vitamine b5": "vitamine_b5",
-            "vitamine b6": "vitamine_b6",
-            "vitamine b9": "vitamine_b9",
-            "vitamine b12": "vitamine_b12",
-            "vitamine c": "vitamine_c",
-            "vitamine d": "vitamine_d",
-            "vitamine e": "vitamine_e",
-            "vitamine k": "vitamine_k2",
-            "calcium": "calcium",
-            "cuivre": "cuivre",
-            "fer": "fer",
-            "iode": "iode",
-            "magnesium": "magnesium",
-            "phosphore": "phosphore",
-            "potassium": "potassium",
-            "selenium": "selenium",
-            "sodium": "sodium",
-            "zinc": "zinc"
-        }
+        df['ref'] = df['ref'].astype(str).str.extract(r'(\d+\.?\d*)', expand=False).astype(float)
+        df['obtained'] = pd.to_numeric(df['obtained'], errors='coerce')
+
+        # The first matching key wins, which np.select preserves through condition order
+        nutrient_names = df['nutrient'].astype(str).str.lower()
+        available = [(key, val) for key, val in self.nutrient_mapping.items() if val in total_nutrition]
+        if available:
+            conditions = [nutrient_names.str.contains(key, regex=False).to_numpy() for key, _ in available]
+            choices = [total_nutrition[val] for _, val in available]
+            df['obtained'] = np.select(conditions, choices, default=df['obtained'].to_numpy())
+
+        obtained = df['obtained'].fillna(0).to_numpy(dtype=np.float64)
+        ref = df['ref'].to_numpy(dtype=np.float64)
 
-        for idx, row in df.iterrows():
-            nutrient_name_full = str(row[nutrient_col]).lower()
-            for key, val in nutrient_mapping.items():
-                if key in nutrient_name_full:
-                    if val in total_nutrition:
-                        df.loc[idx, val_obtenues_col] = total_nutrition[val]
-                        break
-        
-        df[val_obtenues_col] = df[val_obtenues_col].fillna(0)
+        # Rows without a usable reference value get a difference of 0
+        difference = np.zeros_like(obtained)
+        np.divide(obtained - ref, ref, out=difference, where=np.isfinite(ref) & (ref != 0))
+        difference = np.round(difference * 100, 1)
 
-        df['Difference (%)'] = (((df[val_obtenues_col] - df[ref_col]) / df[ref_col]) * 100).round(1)
-        df['Difference (%)'] = df['Difference (%)'].fillna(0)
+        for row, value, diff in zip(rows, obtained, difference):
+            row[val_obtenues_col - 1].value = float(value)
+            sheet.cell(row=row[0].row, column=diff_col, value=float(diff))
 
-        df.to_excel(output_path, index=False)
+        workbook.save(output_path)
     
     def _save_statistics(self, results_by_sex: dict, output_dir: Path) -> None:
         """
@@ -329,8 +432,9 @@ class NutritionCalculator:
                 if not results_by_sex.get(sex):
                     continue
                 
-                # Combine all results for this sex into a DataFrame
-                df = pd.DataFrame(results_by_sex[sex])
+                # Combine all results for this sex into a DataFrame; the Series share the
+                # same nutrient index, so concatenating them skips per-row alignment
+                df = pd.concat(results_by_sex[sex], axis=1).T
                 
                 # Calculate statistics
                 stats = pd.DataFrame({
@@ -348,7 +452,32 @@ class NutritionCalculator:
                 
                 stats.to_excel(writer, sheet_name=label, index=False)
         
-        logger.info(f"Statistiques sauvegardées dans: {output_path}")
+        logger.info("Statistiques sauvegardées dans: %s", output_path)
+
+# Calculator of the current worker process, created once by _init_worker
+_worker_calculator = None
+
+def _init_worker(nutrition_data_path: Path, ref_man_path: Path, ref_woman_path: Path) -> None:
+    """Create the calculator once per worker process so it is reused by every survey."""
+    global _worker_calculator
+    _worker_calculator = NutritionCalculator(nutrition_data_path, ref_man_path, ref_woman_path)
+
+def _process_survey(survey_file: Path, results_dir: Path):
+    """
+    Process a single survey in a worker process.
+    
+    Returns the result (None if it failed), the food matches added while processing it
+    and the cache keys it used, since worker processes do not save the cache themselves.
+    """
+    known_keys = set(_worker_calculator._match_cache)
+    _worker_calculator._used_match_keys = []
+    try:
+        result = _worker_calculator.calculate_nutrition(survey_file, results_dir)
+    except Exception as e:
+        logger.error("Failed to process %s: %s", survey_file.name, e)
+        result = None
+    new_matches = {key: group for key, group in _worker_calculator._match_cache.items() if key not in known_keys}
+    return result, new_matches, _worker_calculator._used_match_keys
 
 def main():
     """Main function to process all surveys in the surveys directory."""
@@ -364,28 +493,33 @@ def main():
     try:
         calculator = NutritionCalculator(nutrition_data_path, ref_man_path, ref_woman_path)
         
-        survey_files = list(surveys_dir.glob("*.xlsx"))
+        survey_files = [f for f in surveys_dir.glob("*.xlsx") if not f.name.startswith('~')]
         
         if not survey_files:
-            logger.warning(f"No Excel files found in {surveys_dir}")
+            logger.warning("No Excel files found in %s", surveys_dir)
             return
         
-        logger.info(f"Found {len(survey_files)} survey files to process")
+        logger.info("Found %d survey files to process", len(survey_files))
         
         # Collect results by sex for aggregate statistics
         results_by_sex = {'M': [], 'F': []}
         
-        for survey_file in survey_files:
-            if survey_file.name.startswith('~'):
-                continue
-            try:
-                result = calculator.calculate_nutrition(survey_file, results_dir)
+        # Surveys are independent, so they are processed in parallel; results come back in file order
+        with ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            initializer=_init_worker,
+            initargs=(nutrition_data_path, ref_man_path, ref_woman_path)
+        ) as executor:
+            results = executor.map(_process_survey, survey_files, repeat(results_dir))
+            for result, new_matches, used_keys in results:
+                calculator._match_cache.update(new_matches)
+                calculator._trim_match_cache(used_keys)
                 if result:
                     sex, nutrition = result
                     results_by_sex[sex].append(nutrition)
-            except Exception as e:
-                logger.error(f"Failed to process {survey_file.name}: {e}")
-                continue
+        
+        # Only the main process writes the match cache, once all workers are done
+        calculator._save_match_cache()
         
         # Generate aggregate statistics if we have results
         if results_by_sex['M'] or results_by_sex['F']:
@@ -394,7 +528,7 @@ def main():
         logger.info("Processing complete!")
         
     except Exception as e:
-        logger.error(f"Fatal error: {e}")
+        logger.error("Fatal error: %s", e)
 
 
 if __name__ == "__main__":